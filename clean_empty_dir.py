@@ -1,55 +1,120 @@
-import os
+import queue
 import sys
+import threading
 from pathlib import Path
 import click # External dependency: pip install click
+from empty_dir_sweep import REMOVED, REMOVE_ERROR, SCAN_ERROR, sweep_empty_dirs
+
+# Most per-directory lines the writer thread joins into a single write
+OUTPUT_BATCH_SIZE = 1000
+# Lines allowed to wait for the writer; beyond that a slow terminal throttles the sweep
+OUTPUT_QUEUE_SIZE = 10000
+
+# Colour codes for the per-directory lines, built once instead of via click.style() per line.
+# The prefixes leave the colour on so the whole line stays coloured until STYLE_RESET.
+DELETED_PREFIX = click.style("  Deleted: ", fg="green", reset=False)
+ERROR_PREFIX = click.style("  Error deleting ", fg="red", reset=False)
+STYLE_RESET = click.style("", reset=True)
+
+def echo_worker(lines: queue.Queue, failures: list[Exception]):
+    """
+    Writes lines from `lines` until it receives None, joining whatever is already
+    waiting (up to OUTPUT_BATCH_SIZE lines) into a single click.echo call.
+
+    If a write fails (e.g. BrokenPipeError once `| head` exits), the error is added
+    to `failures` and the rest of the queue is discarded up to the None, so nothing
+    putting lines on it is left blocked on a full queue.
+    """
+    try:
+        while True:
+            line = lines.get()
+            if line is None:
+                return
+            batch = [line]
+            while len(batch) < OUTPUT_BATCH_SIZE:
+                try:
+                    line = lines.get_nowait()
+                except queue.Empty:
+                    break
+                if line is None:
+                    click.echo("\n".join(batch))
+                    return
+                batch.append(line)
+            click.echo("\n".join(batch))
+    except Exception as e:
+        failures.append(e)
+        if line is not None:
+            while lines.get() is not None:
+                pass
 
 # The core logic function remains largely the same,
 # but now it should ideally just take its parameters and return results.
 # The CLI interactions (print, confirm) are handled by click.
 
-def delete_empty_dirs_recursive(root_dir_path: Path, dry_run: bool = False):
+def delete_empty_dirs_recursive(root_dir_path: Path, dry_run: bool = False, max_workers: int | None = None):
     """
     Recursively finds and (optionally) deletes empty directories
-    starting from root_dir_path.
+    starting from root_dir_path. The traversal itself is empty_dir_sweep.sweep_empty_dirs.
 
     Args:
         root_dir_path (pathlib.Path): The path to the directory to start searching from.
         dry_run (bool): If True, only report what would be deleted.
+        max_workers (int | None): Threads used for the top-level subdirectories.
+            Defaults to min(32, 4 * CPU count).
 
     Returns:
         tuple: (deleted_count, error_count)
     """
-    deleted_count = 0
-    error_count = 0
-
-    for dirpath_str, dirnames, filenames in os.walk(root_dir_path, topdown=False):
-        current_dir = Path(dirpath_str)
-        try:
-            # Check if the directory is empty
-            if not list(current_dir.iterdir()):
-                if dry_run:
-                    click.echo(f"DRY-RUN: Directory '{current_dir}' is empty. Would delete.")
-                    deleted_count += 1
-                else:
-                    click.echo(f"Directory '{current_dir}' is empty. Deleting...")
-                    try:
-                        current_dir.rmdir()
-                        click.echo(click.style(f"  Deleted: '{current_dir}'", fg="green"))
-                        deleted_count += 1
-                    except OSError as e:
-                        click.echo(click.style(f"  Error deleting '{current_dir}': {e}", fg="red"), err=True)
-                        error_count += 1
-            # else: # For debugging if needed
-            #     if list(current_dir.iterdir()):
-            #         click.echo(f"Info: Directory '{current_dir}' contains: {', '.join(p.name for p in current_dir.iterdir())}")
-            #     else:
-            #         click.echo(f"Info: Directory '{current_dir}' is technically empty but not caught by logic?")
-
-
-        except OSError as e:
-             click.echo(click.style(f"  Error accessing or listing contents of '{current_dir}': {e}", fg="red"), err=True)
-             error_count += 1
-    return deleted_count, error_count
+    # Per-directory progress lines are handed to a writer thread, so terminal writes
+    # overlap with the scandir/rmdir work instead of blocking it.
+    # Errors are rare and still go straight to stderr.
+    output_queue: queue.Queue = queue.Queue(maxsize=OUTPUT_QUEUE_SIZE)
+    # Set by the writer if it can't write any more
+    writer_failures: list[Exception] = []
+    put_line = output_queue.put
+
+    def emit(line: str):
+        # Once the writer has failed, stop the sweep with its error instead of queueing
+        # output nobody will see
+        if writer_failures:
+            raise writer_failures[0]
+        put_line(line)
+
+    def report_error(kind: str, path: str, detail):
+        if kind == REMOVE_ERROR:
+            click.echo(f"{ERROR_PREFIX}'{path}': {detail}{STYLE_RESET}", err=True)
+        elif kind == SCAN_ERROR:
+            click.echo(click.style(f"  Error accessing or listing contents of '{path}': {detail}", fg="red"), err=True)
+
+    # The mode is fixed for the whole run, so the reporter is chosen once here
+    # rather than checking dry_run again for every directory found.
+    if dry_run:
+        def report(kind: str, path: str, detail):
+            if kind == REMOVED:
+                emit(f"DRY-RUN: Directory '{path}' is empty. Would delete.")
+            else:
+                report_error(kind, path, detail)
+        # Nothing is removed, but the directory still counts as gone for its parent
+        remover = lambda path: None
+    else:
+        def report(kind: str, path: str, detail):
+            if kind == REMOVED:
+                emit(f"{DELETED_PREFIX}'{path}'{STYLE_RESET}")
+            else:
+                report_error(kind, path, detail)
+        remover = None
+
+    writer = threading.Thread(target=echo_worker, args=(output_queue, writer_failures), daemon=True)
+    writer.start()
+    try:
+        counts = sweep_empty_dirs(root_dir_path, remover, report, max_workers=max_workers)
+    finally:
+        # Let the writer drain everything queued before the summary is printed
+        output_queue.put(None)
+        writer.join()
+    if writer_failures:
+        raise writer_failures[0]
+    return counts
 
 @click.command()
 @click.argument(
@@ -1,101 +1,170 @@
 import os
 import sys
+import threading
 from pathlib import Path
 import click
 from loguru import logger
 from send2trash import send2trash
+from empty_dir_sweep import KEPT, REMOVED, sweep_empty_dirs
 
 # Configure loguru for clean output
 logger.remove()
 # Customize format for verbosity later if needed
 logger.add(sys.stderr, format="<level>{level: <8}</level> | <cyan>{message}</cyan>", level="INFO")
 
+# send2trash accepts a list of paths (send2trash>=1.8), which lets the macOS and Windows
+# backends trash a whole batch in one operation instead of one per directory.
+TRASH_BATCH_SIZE = 256
 
-def delete_empty_recursive(root_dir_path: Path, force_delete: bool, verbose_level: int):
-    """
-    Recursively finds and removes empty directories using os.walk for traversal
-    and pathlib for operations.
-
-    Args:
-        root_dir_path (Path): The path to the directory to start searching from.
-        force_delete (bool): If True, permanently delete. Otherwise, send to trash.
-        verbose_level (int): Verbosity level for logging.
-
-    Returns:
-        tuple: (deleted_count, error_count)
-    """
-    deleted_count = 0
-    error_count = 0
 
+def configure_logging(verbose_level: int):
+    """Switches the loguru sink to DEBUG (-v) or TRACE (-vv); INFO otherwise."""
     if verbose_level >= 2: # Extremely verbose
-        logger.opt(depth=1).info("Log level set to TRACE")
+        logger.info("Log level set to TRACE")
         logger.remove()
         logger.add(sys.stderr, format="<green>{time:HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{message}</cyan>", level="TRACE")
     elif verbose_level == 1: # Debug
-        logger.opt(depth=1).info("Log level set to DEBUG")
+        logger.info("Log level set to DEBUG")
         logger.remove()
         logger.add(sys.stderr, format="<green>{time:HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{message}</cyan>", level="DEBUG")
     # Else, default INFO level remains
 
-    # Walk the directory tree bottom-up
-    for dirpath_str, dirnames, filenames in os.walk(root_dir_path, topdown=False):
-        current_dir = Path(dirpath_str)
-        logger.trace(f"Checking directory: {current_dir}")
 
-        # Don't try to delete the root_dir_path itself within the os.walk loop if it's the starting point
-        # It will be handled after the loop if it's empty
-        # However, os.walk(topdown=False) processes children first, so this isn't strictly
-        # necessary for `current_dir == root_dir_path` unless `root_dir_path` has no subdirs.
-        # More importantly, we want to avoid processing non-directories if os.walk somehow yielded one (shouldn't happen for dirpath).
+def delete_empty_recursive(root_dir_path: Path, force_delete: bool, verbose_level: int):
+    """
+    Recursively finds and removes empty directories. The traversal itself is
+    empty_dir_sweep.sweep_empty_dirs; this decides how they're removed and logged.
+
+    Args:
+        root_dir_path (Path): The path to the directory to start searching from.
+        force_delete (bool): If True, permanently delete. Otherwise, send to trash.
+        verbose_level (int): Verbosity level for logging.
 
+    Returns:
+        tuple: (deleted_count, error_count)
+    """
+    # Checked per directory so the TRACE/DEBUG f-strings are only built when they'd be shown
+    trace_enabled = verbose_level >= 2
+    debug_enabled = verbose_level >= 1
+
+    # Empty directories waiting to be sent to the trash, children before their parents.
+    # The sweep calls queue_for_trash from several threads.
+    trash_batch: list[str] = []
+    trash_lock = threading.Lock()
+    sent_count = 0
+    trash_error_count = 0
+    # Directories that couldn't be trashed or weren't empty any more, across all batches,
+    # together with their ancestors up to the root: those aren't empty either.
+    root = os.fspath(root_dir_path)
+    left_in_place: set[str] = set()
+
+    def leave_in_place(path: str):
+        # Stops at an ancestor already in the set, since the rest above it are too
+        while path not in left_in_place:
+            left_in_place.add(path)
+            parent = os.path.dirname(path)
+            if path == root or parent == path:
+                return
+            path = parent
+
+    def still_empty(path: str, batch: set[str]) -> bool:
+        """
+        Re-checks that `path` is still empty right before it's trashed, apart from
+        subdirectories trashed along with it in `batch`. send2trash moves the whole
+        directory, so anything created in it since the sweep would go along.
+        """
+        with os.scandir(path) as it:
+            return all(entry.path in batch for entry in it)
+
+    def flush_trash():
+        nonlocal sent_count, trash_error_count
+        batch: dict[str, None] = {}
+        for path in trash_batch:
+            if path in left_in_place:
+                logger.debug(f"Keeping '{path}': something in it stays")
+                continue
+            try:
+                if not still_empty(path, batch):
+                    logger.info(f"Keeping '{path}': no longer empty")
+                    leave_in_place(path)
+                    continue
+            except FileNotFoundError:
+                # Removed by something else meanwhile; nothing to trash
+                continue
+            except OSError as e:
+                leave_in_place(path)
+                trash_error_count += 1
+                logger.error(f"Error processing '{path}': {e}")
+                continue
+            batch[path] = None
+        trash_batch.clear()
+        if not batch:
+            return
         try:
-            # Check if the directory is empty
-            # list(current_dir.iterdir()) is fine, or use `any` for slight optimization
-            # if not any(current_dir.iterdir()): # More efficient for just checking emptiness
-            if not list(current_dir.iterdir()):
-                logger.debug(f"Found empty directory: {current_dir}")
-
-                if force_delete:
-                    current_dir.rmdir()
-                    logger.info(f"Permanently deleted: {current_dir}")
-                else:
-                    send2trash(str(current_dir)) # send2trash needs a string path
-                    logger.info(f"Sent to trash: {current_dir}")
-                deleted_count += 1
-            else:
-                if verbose_level >=2: # TRACE level example
-                    contents = [p.name for p in current_dir.iterdir()]
-                    logger.trace(f"Directory '{current_dir}' not empty. Contains: {contents[:5]}{'...' if len(contents) > 5 else ''}")
-
-
-        except FileNotFoundError:
-            # This can happen if a parent directory was deleted in a previous iteration
-            # and it contained this current_dir.
-            logger.trace(f"Directory {current_dir} not found, likely deleted as part of an empty parent.")
-            pass # It's already gone or was part of a parent that was deleted.
+            send2trash(list(batch))
+            for path in batch:
+                logger.info(f"Sent to trash: {path}")
+            sent_count += len(batch)
         except OSError as e:
-            # Handles permission errors for listdir or rmdir/send2trash
-            error_count += 1
-            logger.error(f"Error processing '{current_dir}': {e}")
-
-    # Final check for the root directory itself, in case it became empty
-    # This is important because os.walk might not yield the root if it had no subdirs
-    # or it's just cleaner to handle it post-loop.
-    try:
-        if root_dir_path.exists() and not list(root_dir_path.iterdir()):
-            logger.debug(f"Root directory '{root_dir_path}' is now empty.")
-            if force_delete:
-                root_dir_path.rmdir()
-                logger.info(f"Permanently deleted root directory: {root_dir_path}")
-            else:
-                send2trash(str(root_dir_path))
-                logger.info(f"Sent root directory to trash: {root_dir_path}")
-            deleted_count += 1
-    except OSError as e:
-        error_count += 1
-        logger.error(f"Error processing root directory '{root_dir_path}' after scan: {e}")
-
+            # Part of the batch may already be gone; retry the rest one by one to find the culprit(s)
+            logger.debug(f"Batch send to trash failed ({e}), retrying individually")
+            for path in batch:
+                if not os.path.lexists(path):
+                    logger.info(f"Sent to trash: {path}")
+                    sent_count += 1
+                elif path in left_in_place:
+                    # A child failed, so this directory isn't empty after all
+                    continue
+                else:
+                    try:
+                        send2trash(path)
+                        logger.info(f"Sent to trash: {path}")
+                        sent_count += 1
+                    except OSError as e:
+                        leave_in_place(path)
+                        trash_error_count += 1
+                        logger.error(f"Error processing '{path}': {e}")
+
+    def queue_for_trash(path: str):
+        # Counted (and logged) once the batch has actually been trashed
+        with trash_lock:
+            trash_batch.append(path)
+            if len(trash_batch) >= TRASH_BATCH_SIZE:
+                flush_trash()
+
+    # What a removed directory logs depends only on the mode, so it's picked once here
+    # instead of being re-decided for every directory
+    if force_delete:
+        def on_removed(path: str):
+            logger.info(f"Permanently deleted: {path}")
+    elif debug_enabled:
+        def on_removed(path: str):
+            logger.debug(f"Found empty directory: {path}")
+    else:
+        # Logged as "Sent to trash" once the batch is flushed
+        def on_removed(path: str):
+            pass
 
+    def report(kind: str, path: str, detail):
+        if kind == REMOVED:
+            on_removed(path)
+        elif kind == KEPT:
+            # TRACE level example; the sweep collects one name more than shown to know about the rest
+            logger.trace(f"Directory '{path}' not empty. Contains: {detail[:5]}{'...' if len(detail) > 5 else ''}")
+        else:
+            # Permission errors listing or removing a directory
+            logger.error(f"Error processing '{path}': {detail}")
+
+    deleted_count, error_count = sweep_empty_dirs(
+        root_dir_path,
+        None if force_delete else queue_for_trash,
+        report,
+        preview=6 if trace_enabled else 0,
+    )
+    if not force_delete:
+        flush_trash()
+        deleted_count = sent_count
+        error_count += trash_error_count
     return deleted_count, error_count
 
 
@@ -109,7 +178,8 @@ def cli(root_dir: Path, force: bool, verbose: int, yes: bool):
     Recursively find and remove empty directories.
     By default, sends directories to trash. Use --force for permanent deletion.
     """
-    # Adjust logger level based on verbosity (done inside the function now)
+    # Adjust logger level based on verbosity before any scanning starts
+    configure_logging(verbose)
 
     click.echo(f"Scanning: {root_dir.resolve()}")
     if not force:
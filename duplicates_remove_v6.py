@@ -3,73 +3,117 @@ import os
 import re
 import sys
 import argparse
+import contextlib
+import functools
 from pathlib import Path
 import time # Import time for stat call
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
+
+@contextlib.contextmanager
+def buffered_stdout():
+    """
+    Switches a line-buffered stdout (a terminal) to block buffering for the duration,
+    so the report's many short print() calls are written out in large chunks instead
+    of one write per line. Flushed and restored on exit. Only meant for stretches that
+    print without waiting on anything; progress lines before slow work would otherwise
+    stay hidden until the buffer fills.
+    """
+    stdout = sys.stdout
+    if not getattr(stdout, "line_buffering", False) or not hasattr(stdout, "reconfigure"):
+        # Already block-buffered (redirected to a file or pipe), or not a TextIOWrapper
+        yield
+        return
+    stdout.reconfigure(line_buffering=False)
+    try:
+        yield
+    finally:
+        stdout.flush()
+        stdout.reconfigure(line_buffering=True)
+
+# Each unit is 1024 times the previous one
+SIZE_UNITS = ("bytes", "KB", "MB", "GB", "TB", "PB")
 
 def format_size(size_bytes):
     """Format file size in a human-readable format."""
     if size_bytes is None:
         return "N/A"
-    if size_bytes < 1024:
+    # Every 10 bits is one unit up, so the bit length picks the unit without a chain of comparisons
+    unit = min(max(size_bytes.bit_length() - 1, 0) // 10, len(SIZE_UNITS) - 1)
+    if unit == 0:
         return f"{size_bytes} bytes"
-    elif size_bytes < 1024 * 1024:
-        return f"{size_bytes / 1024:.1f} KB"
-    elif size_bytes < 1024 * 1024 * 1024:
-        return f"{size_bytes / (1024 * 1024):.1f} MB"
-    else:
-        return f"{size_bytes / (1024 * 1024 * 1024):.1f} GB"
+    return f"{size_bytes / (1 << (10 * unit)):.1f} {SIZE_UNITS[unit]}"
 
-def clean_filename(filename, pattern_compiled, detect_copy):
+# Default pattern for numerical duplicate indicators; \s* handles the space before (1)
+DEFAULT_PATTERN = r'\s*\(\d+\)'
+
+# Appended to the user's pattern when copy detection is on. Like the old rfind() checks,
+# ".copy" / " - copy" match in any case and cut off the rest of the stem with them.
+COPY_MARKER_PATTERN = r'(?is:(?:\.copy| - copy).*)'
+
+@functools.lru_cache(maxsize=128)
+def build_pattern(pattern, detect_copy):
+    """
+    Compiles the pattern clean_filename() removes: `pattern`, plus the .copy / - copy
+    markers if detect_copy is set. The trailing + lets a single match take several
+    markers in a row. Cached, so calling find_and_remove_duplicates() repeatedly with
+    the same options doesn't recompile it. Raises re.error for an invalid pattern.
+    """
+    markers = f"(?:{pattern})|{COPY_MARKER_PATTERN}" if detect_copy else pattern
+    return re.compile(f"(?:{markers})+")
+
+# Cached: the same name often turns up in many directories (e.g. "IMG_0001 (1).jpg")
+@functools.lru_cache(maxsize=100_000)
+def strip_duplicate_markers(filename, pattern_compiled):
     """
     Iteratively removes duplicate patterns ((N), .copy, - copy) from a filename's stem.
-    Returns the cleaned stem + original suffix.
+    pattern_compiled already includes the .copy / - copy markers if they're to be detected.
+
+    Returns:
+        tuple: (stem, cleaned_stem, suffix)
     """
-    path_obj = Path(filename)
-    stem = path_obj.stem
-    suffix = path_obj.suffix
+    # Same split as Path(filename).stem / .suffix, without building a Path per name:
+    # the suffix starts at the last dot, unless that dot starts or ends the name
+    dot = filename.rfind(".")
+    if 0 < dot < len(filename) - 1:
+        stem, suffix = filename[:dot], filename[dot:]
+    else:
+        stem, suffix = filename, ""
     
     cleaned_stem = stem
     
-    # Keep trying to remove patterns until no more changes are made
+    # The pattern matches a whole run of consecutive markers ("x (1) (2) - copy"), so
+    # usually one pass removes everything and the next finds nothing. It is repeated
+    # until nothing changes, because stripping the result can let an anchored pattern
+    # match again, or a removal can expose a new marker ("(1(2))" -> "(1)").
     while True:
-        original_cleaned_stem = cleaned_stem
-        
-        # 1. Attempt to remove regex pattern
-        # Use search and sub to find/remove pattern anywhere in the stem
-        match = pattern_compiled.search(cleaned_stem)
-        if match:
-            # Replace the matched pattern with an empty string
-            # Use span() to get the start and end indices of the match
-            start, end = match.span()
-            cleaned_stem = cleaned_stem[:start] + cleaned_stem[end:]
-            cleaned_stem = cleaned_stem.strip() # Strip potential leading/trailing spaces after removal
-            
-        # 2. Attempt to remove specific string copy patterns (.copy, - copy) if enabled
-        if detect_copy:
-            lower_stem = cleaned_stem.lower()
-            
-            # Find the last occurrence of ".copy" and " - copy" (case-insensitive)
-            dot_copy_index = lower_stem.rfind(".copy")
-            space_copy_index = lower_stem.rfind(" - copy") # Note: searching for " - copy"
-
-            # Determine which pattern appears last (highest index) in the string
-            if space_copy_index > dot_copy_index:
-                 # " - copy" is the last pattern found
-                 cleaned_stem = cleaned_stem[:space_copy_index].strip()
-            elif dot_copy_index != -1: # ".copy" was found, and was not preceded by " - copy" immediately before it
-                 # ".copy" is the last pattern found (or the only one)
-                 cleaned_stem = cleaned_stem[:dot_copy_index].strip()
+        # Remove the first match, as search() + slicing did; subn() also reports whether
+        # there was one, so no separate search() is needed
+        new_stem, removed = pattern_compiled.subn("", cleaned_stem, count=1)
+        if not removed:
+            break
+        new_stem = new_stem.strip() # Strip potential leading/trailing spaces after removal
+        # An empty match (e.g. pattern '\s*') "removes" nothing; stop rather than loop forever
+        if new_stem == cleaned_stem:
+            break
+        cleaned_stem = new_stem
 
+    return stem, cleaned_stem, suffix
 
-        # If no patterns were removed in this pass of checks, we're done
-        if cleaned_stem == original_cleaned_stem:
-            break
+def clean_filename(filename, pattern_compiled):
+    """
+    Removes duplicate patterns ((N), .copy, - copy) from a filename's stem.
+    Returns the cleaned stem + original suffix.
+    """
+    stem, cleaned_stem, suffix = strip_duplicate_markers(filename, pattern_compiled)
 
     # Reconstruct filename
     cleaned_filename = cleaned_stem + suffix
     
     # Add a basic safety check - if cleaned_stem is empty after removal but original wasn't
     # This might happen with patterns that consume the whole name e.g. pattern='.*'
+    # (Checked here rather than in the cached function so it's reported for every file)
     if not cleaned_stem and stem:
          # This warning is more informative if cleaning results in an empty name
          print(f"Warning: Cleaning stem '{stem}' resulted in an empty string.")
@@ -78,7 +122,185 @@ def clean_filename(filename, pattern_compiled, detect_copy):
 
     return cleaned_filename
 
-def find_and_remove_duplicates(directory_path_str, dry_run=False, pattern=r'\s*\(\d+\)', auto_confirm=False, detect_copy=False, recursive=False):
+# Windows and macOS filesystems normally treat names that differ only in case as the
+# same name, so there such files are grouped together; elsewhere they're distinct files
+CASE_INSENSITIVE_NAMES = os.name == "nt" or sys.platform == "darwin"
+# Applied to names (and paths) before they're compared or sorted
+fold_case = str.casefold if CASE_INSENSITIVE_NAMES else str
+
+# Below this many files, starting worker processes costs more than cleaning the names in-process
+PARALLEL_CLEAN_MIN_FILES = 50_000
+
+def clean_names(names, pattern, detect_copy):
+    """
+    Returns clean_filename() of each name in `names`. Takes the pattern as a string
+    so it can run in a worker process of clean_all_names(); build_pattern() caches
+    the compiled pattern per process.
+    """
+    pattern_compiled = build_pattern(pattern, detect_copy)
+    if pattern != DEFAULT_PATTERN:
+        return [clean_filename(name, pattern_compiled) for name in names]
+    # Every match of the default pattern contains "(", and every copy marker "copy" (in any
+    # case). Most names have neither, and a name without a match comes back unchanged, so
+    # those skip the regex. A custom pattern could match anything, so it gets no shortcut.
+    return [
+        clean_filename(name, pattern_compiled) if "(" in name or (detect_copy and "copy" in name.lower()) else name
+        for name in names
+    ]
+
+def clean_all_names(names, pattern, detect_copy):
+    """
+    Cleans every name in `names`, in order. The regex work is CPU-bound and threads
+    can't run it in parallel under the GIL, so large scans split it across one
+    process per CPU instead.
+
+    Args:
+        names (list of str): File names to clean
+        pattern (str): Regular expression pattern, as given to build_pattern()
+        detect_copy (bool): Whether to also remove .copy / - copy markers
+
+    Returns:
+        list: The cleaned names, one per entry in `names`
+    """
+    workers = os.cpu_count() or 1
+    if len(names) < PARALLEL_CLEAN_MIN_FILES or workers < 2:
+        return clean_names(names, pattern, detect_copy)
+
+    # A few chunks per worker so one slow chunk doesn't leave the others idle at the end
+    chunk_size = -(-len(names) // (workers * 4))
+    chunks = [names[i:i + chunk_size] for i in range(0, len(names), chunk_size)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # map() returns the chunks in order, so the groups keep the scan order
+        cleaned_chunks = executor.map(clean_names, chunks, repeat(pattern), repeat(detect_copy))
+        return [cleaned for chunk in cleaned_chunks for cleaned in chunk]
+
+def scan_files(directory, recursive):
+    """
+    Yields an os.DirEntry for every file in `directory`, and in its subdirectories
+    if `recursive` is set, in the same order as Path.rglob('*') / iterdir().
+
+    os.scandir reports each entry's type along with its name, so telling files from
+    directories needs no stat() per entry (unlike Path.is_file()). Only symlinks
+    cost an extra stat: like Path.is_file(), a symlink to a file counts as a file.
+    Symlinked directories are not descended into, as with rglob(). An entry that
+    can't be stat()ed (e.g. a symlink loop) is skipped, not an error.
+    Subdirectories that can't be listed are reported and skipped; an error listing
+    `directory` itself is raised to the caller.
+    """
+    pending = [directory]
+    while pending:
+        current = pending.pop()
+        subdirs = []
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    try:
+                        is_file = entry.is_file()
+                    except OSError:
+                        # e.g. a symlink loop (ELOOP); Path.is_file() also says False
+                        is_file = False
+                    if is_file:
+                        yield entry
+                    elif recursive and entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+        except OSError as e:
+            if current is directory:
+                raise
+            print(f"Warning: Could not scan directory '{current}': {e}. Skipping.")
+        # Reversed so the subdirectories are popped (and scanned) in listing order
+        pending.extend(reversed(subdirs))
+
+def default_stat_threads():
+    """Default number of threads for stat_files(): min(32, 4 * CPU count)."""
+    return min(32, (os.cpu_count() or 1) * 4)
+
+def stat_files(paths, max_workers=None):
+    """
+    Stats each path once, up front, so grouping and reporting can read st_ctime and
+    st_size from the result instead of calling stat() again every time they need it.
+    The calls run on a thread pool: stat() releases the GIL, so on network shares or
+    slow disks many of them can be in flight at once instead of waiting one by one.
+    Symlinks are not followed: a symlink's own size and ctime are used, it costs no
+    extra lookup of its target, and a broken one doesn't fail.
+
+    Args:
+        paths (iterable of Path or os.DirEntry): Files to stat
+        max_workers (int): Number of threads. Defaults to default_stat_threads()
+
+    Returns:
+        dict: Path -> os.stat_result, or the exception stat() raised for that path
+    """
+    def stat_or_error(path):
+        try:
+            return path.stat(follow_symlinks=False)
+        except Exception as e:
+            # Kept so the caller can report it against the file's group
+            return e
+
+    paths = list(paths)
+    if max_workers is None:
+        max_workers = default_stat_threads()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip(paths, executor.map(stat_or_error, paths)))
+
+# Default number of threads deleting files at once
+DEFAULT_DELETE_THREADS = 8
+# Most files of one directory a deletion thread removes per task (and per opened directory)
+UNLINK_BATCH_SIZE = 64
+# Unlink batches queued ahead of the report, per deletion thread. Kept small so that on
+# Ctrl+C only a few batches beyond what was reported can have been deleted
+UNLINK_BATCHES_AHEAD = 2
+# Returned by unlink_file() for a file that was already gone
+FILE_GONE = "gone"
+
+# Unlink relative to an open directory (unlinkat) where the platform supports it (not on Windows)
+UNLINK_DIR_FD = os.unlink in os.supports_dir_fd
+DIR_OPEN_FLAGS = os.O_RDONLY | getattr(os, "O_DIRECTORY", 0)
+
+def unlink_file(path, dir_fd=None):
+    """
+    Deletes one file: `path`, or the name `path` inside the directory open as `dir_fd`.
+    Runs on the deletion thread pool, so it reports the outcome instead of printing it.
+    A symlink is deleted itself, whether or not its target still exists.
+
+    Returns:
+        None if the file was deleted, FILE_GONE if it no longer existed,
+        otherwise the error message to show
+    """
+    try:
+        # No separate exists() check: unlink() says so itself if the file is gone
+        os.unlink(path, dir_fd=dir_fd)
+    except FileNotFoundError:
+        return FILE_GONE
+    except PermissionError:
+        return "Permission denied."
+    except OSError as e:
+        return f"OS error: {e}"
+    except Exception as e:
+        return f"An unexpected error occurred: {e}"
+    return None
+
+def unlink_files_in(directory, names):
+    """
+    Deletes each of `names` from `directory` with unlink_file() and returns the
+    outcomes in the same order. Where supported, the directory is opened once and
+    the names are unlinked relative to it, so the kernel doesn't resolve the whole
+    path again for every file.
+    """
+    if UNLINK_DIR_FD:
+        try:
+            dir_fd = os.open(directory, DIR_OPEN_FLAGS)
+        except OSError:
+            # Fall through to the full paths, which report the problem per file
+            pass
+        else:
+            try:
+                return [unlink_file(name, dir_fd) for name in names]
+            finally:
+                os.close(dir_fd)
+    return [unlink_file(os.path.join(directory, name)) for name in names]
+
+def find_and_remove_duplicates(directory_path_str, dry_run=False, pattern=DEFAULT_PATTERN, auto_confirm=False, detect_copy=False, recursive=False, stat_threads=None, delete_threads=None, verbose=False):
     """
     Find and remove files with duplicate markers like "(1)", ".copy", or " - copy"
     in the filename. Groups files based on their name after removing patterns and
@@ -91,6 +313,9 @@ def find_and_remove_duplicates(directory_path_str, dry_run=False, pattern=r'\s*\
         auto_confirm (bool): If True, skip confirmation prompt
         detect_copy (bool): If True, also detect files ending with ".copy" or " - copy"
         recursive (bool): If True, scan subdirectories recursively
+        stat_threads (int): Threads used to stat duplicate candidates (default: min(32, 4 * CPU count))
+        delete_threads (int): Threads used to delete files (default: DEFAULT_DELETE_THREADS)
+        verbose (bool): If True, list every file even when auto_confirm skips the prompt
     """
     directory = Path(directory_path_str).expanduser().resolve()
     
@@ -107,12 +332,14 @@ def find_and_remove_duplicates(directory_path_str, dry_run=False, pattern=r'\s*\
     pattern_info = f"using pattern: '{pattern}'" + (f" and detecting '.copy' / ' - copy' patterns" if detect_copy else "")
     print(f"{scan_method} scanning {pattern_info}\n")
     
-    # Group files by their "base" name (what they would be after cleaning duplicate markers)
-    file_groups = {}
+    # Group files by their "base" name (what they would be after cleaning duplicate markers).
+    # A defaultdict, so adding a file to its group is a single lookup.
+    file_groups = defaultdict(list)
     
-    # Compile the regex pattern once
+    # Compile the regex pattern up front (combined with the copy markers if those are detected
+    # too) so an invalid one is reported before scanning; build_pattern() caches the result
     try:
-        pattern_compiled = re.compile(pattern)
+        build_pattern(pattern, detect_copy)
     except re.error as e:
         print(f"Error: Invalid regular expression pattern '{pattern}': {e}")
         return
@@ -124,7 +351,7 @@ def find_and_remove_duplicates(directory_path_str, dry_run=False, pattern=r'\s*\
         print("Gathering files recursively...")
         try:
             # We only need files, not dirs or symlinks that aren't files
-            all_files = [entry for entry in directory.rglob('*') if entry.is_file()]
+            all_files = list(scan_files(directory, recursive=True))
         except PermissionError as e:
              print(f"Error accessing directory during recursive scan: {e}")
              print("Scanning may be incomplete due to permissions.")
@@ -139,7 +366,7 @@ def find_and_remove_duplicates(directory_path_str, dry_run=False, pattern=r'\s*\
     else:
         try:
             # We only need files, not dirs or symlinks that aren't files
-            all_files = [entry for entry in directory.iterdir() if entry.is_file()]
+            all_files = list(scan_files(directory, recursive=False))
         except PermissionError as e:
             print(f"Error accessing directory {directory}: {e}")
             return # Cannot proceed without listing files
@@ -148,65 +375,63 @@ def find_and_remove_duplicates(directory_path_str, dry_run=False, pattern=r'\s*\
              return
 
     print("Grouping files...")
-    # Group files based on their cleaned name (case-insensitive grouping key)
-    for file_path in all_files:
+    # Use the file names for cleaning; on large scans this runs in several processes
+    cleaned_names = clean_all_names([file_path.name for file_path in all_files], pattern, detect_copy)
+
+    # Group files based on their cleaned name (case-insensitive where the platform is)
+    for file_path, cleaned_name in zip(all_files, cleaned_names):
         try:
-            # Check if we have permission to read basic file info (like name)
-            # and if the file hasn't disappeared.
-            # is_file() and stat() checks later will help, but this is a good spot for name cleaning.
-            
-            # Use the full file path's name for cleaning
-            cleaned_name = clean_filename(file_path.name, pattern_compiled, detect_copy)
-            
             # The group key should uniquely identify the *set* of duplicates.
-            # Combining the parent directory path with the cleaned name makes the key unique per directory.
-            # Use lower() for case-insensitive grouping key comparison.
-            group_key = str(file_path.parent / cleaned_name).lower()
-            
-            if group_key not in file_groups:
-                file_groups[group_key] = []
-            
+            # Pairing the parent directory with the cleaned name makes the key unique per directory.
+            # All files of a directory share the same parent string, so only the name needs folding.
+            group_key = (os.path.dirname(file_path.path), fold_case(cleaned_name))
             file_groups[group_key].append(file_path)
             
         except Exception as e:
-            print(f"Error processing file '{file_path.name}' at '{file_path}': {e}")
+            print(f"Error processing file '{file_path.name}' at '{file_path.path}': {e}")
             # Skip this file if processing fails
 
+    # Only files that share a group with another file need their stat info;
+    # fetch it for all of them in one pass
+    stat_cache = stat_files((f for files in file_groups.values() if len(files) > 1 for f in files), stat_threads)
+
     # Filter out groups with only one file (these have no duplicates)
     # Also sort the files within each group by creation time
     groups_with_duplicates = {}
     for group_key, files in file_groups.items():
         if len(files) > 1:
             try:
-                # Attempt to get stat for all files in the group before sorting
-                # This preemptively catches permission/existence errors for stat()
+                # Look up the stat for all files in the group before sorting
+                # Files whose stat() failed (permission/existence errors) are reported and dropped
                 files_with_stat = []
                 for f in files:
-                    try:
-                        files_with_stat.append((f, f.stat()))
-                    except FileNotFoundError:
-                         print(f"Warning: File '{f.name}' not found in group '{Path(group_key).name}'. Skipping.")
+                    file_stat = stat_cache[f]
+                    if isinstance(file_stat, FileNotFoundError):
+                         print(f"Warning: File '{f.name}' not found in group '{group_key[1]}'. Skipping.")
                          # Don't add to files_with_stat if not found
-                    except PermissionError:
-                         print(f"Warning: Permission denied for '{f.name}' in group '{Path(group_key).name}'. Skipping.")
+                    elif isinstance(file_stat, PermissionError):
+                         print(f"Warning: Permission denied for '{f.name}' in group '{group_key[1]}'. Skipping.")
                          # Don't add to files_with_stat if permission denied
-                    except Exception as e:
-                         print(f"Warning: Could not stat file '{f.name}' in group '{Path(group_key).name}': {e}. Skipping.")
+                    elif isinstance(file_stat, Exception):
+                         print(f"Warning: Could not stat file '{f.name}' in group '{group_key[1]}': {file_stat}. Skipping.")
                          # Don't add to files_with_stat if other stat error
+                    else:
+                        # From here on the file is handled as a Path
+                        files_with_stat.append((Path(f.path), file_stat))
 
                 if len(files_with_stat) > 1: # Ensure we still have more than one file after stat filtering
                      # Sort files (Path object) based on the creation time from the stat object
                      files_with_stat.sort(key=lambda item: item[1].st_ctime)
-                     # Store just the Path objects back in the group
-                     groups_with_duplicates[group_key] = [item[0] for item in files_with_stat]
+                     # Keep the stat with each Path; the report below reads size and ctime from it
+                     groups_with_duplicates[group_key] = files_with_stat
                 else:
                      # If filtering leaves 0 or 1 file, it's no longer a duplicate group
-                     # print(f"Info: Group '{Path(group_key).name}' reduced to {len(files_with_stat)} file(s) after stat checks. Skipping.")
+                     # print(f"Info: Group '{group_key[1]}' reduced to {len(files_with_stat)} file(s) after stat checks. Skipping.")
                      pass # Skip groups that no longer have duplicates after stat check
 
             except Exception as e:
                  # Catch any unexpected error during group processing/sorting
-                 print(f"Warning: An unexpected error occurred while processing group '{Path(group_key).name}': {e}. Skipping group.")
+                 print(f"Warning: An unexpected error occurred while processing group '{group_key[1]}': {e}. Skipping group.")
 
 
     file_groups = groups_with_duplicates # Use the filtered and sorted groups
@@ -221,58 +446,64 @@ def find_and_remove_duplicates(directory_path_str, dry_run=False, pattern=r'\s*\
             print("\nThis was a dry run. No files would have been deleted.")
         return
 
-    print("\n--- Duplicate Groups Found ---")
-    for group_key, files in file_groups.items():
-        if not files: continue # Should not happen with the filtering above, but safeguard
+    # With --yes nobody reviews the list before deleting, so unless --verbose asks for it
+    # (or it's a dry run) skip the per-file report and just collect what to delete
+    show_files = verbose or dry_run or not auto_confirm
+    if not show_files:
+        files_to_remove = [(file_path, file_stat.st_size) for files in file_groups.values() for file_path, file_stat in files[1:]]
+    else:
+        with buffered_stdout():
+            print("\n--- Duplicate Groups Found ---")
+            for group_key, files in file_groups.items():
+                if not files: continue # Should not happen with the filtering above, but safeguard
 
-        # The oldest file in the sorted list is the one to keep
-        keep_file = files[0]
+                # The oldest file in the sorted list is the one to keep
+                keep_file, keep_stat = files[0]
         
-        print(f"Group (from cleaned name: '{Path(group_key).name}')")
+                print(f"Group (from cleaned name: '{group_key[1]}')")
         
-        try:
-            keep_stat = keep_file.stat()
-            print(f"  Keeping: '{keep_file.name}' (Oldest, created {time.ctime(keep_stat.st_ctime)})")
-            # Show relative path if recursive, or just directory name if not
-            display_path = keep_file.parent if recursive else keep_file.parent.name
-            if display_path == Path("."): display_path = "Current directory" # Nicer output for '.'
-            try:
-                 print(f"    Location:                {display_path}")
-            except ValueError: # Should not happen for parent, but relative_to might if directory was symlink etc.
-                 print(f"    Absolute Path:           {keep_file.parent}")
-        except Exception as e:
-             print(f"  Keeping: '{keep_file.name}' (Info unavailable: {e})")
-             display_path = keep_file.parent if recursive else keep_file.parent.name
-             if display_path == Path("."): display_path = "Current directory"
-             try:
-                  print(f"    Location:                {display_path}")
-             except ValueError:
-                  print(f"    Absolute Path:           {keep_file.parent}")
-
-
-        # All other files in the group are duplicates to be removed
-        duplicates_in_group = files[1:]
-        # No need to check if duplicates_in_group is empty, files[1:] handles it
-
-        for file_to_delete in duplicates_in_group:
-            try:
-                file_size = file_to_delete.stat().st_size
-                total_size_to_delete += file_size
-                files_to_remove.append((file_to_delete, file_size))
-                print(f"  Deleting: '{file_to_delete.name}' ({format_size(file_size)}) (created {time.ctime(file_to_delete.stat().st_ctime)})")
-                display_path = file_to_delete.parent if recursive else file_to_delete.parent.name
-                if display_path == Path("."): display_path = "Current directory"
                 try:
-                    print(f"    Location:                {display_path}")
-                except ValueError:
-                     print(f"    Absolute Path:           {file_to_delete.parent}")
+                    print(f"  Keeping: '{keep_file.name}' (Oldest, created {time.ctime(keep_stat.st_ctime)})")
+                    # Show relative path if recursive, or just directory name if not
+                    display_path = keep_file.parent if recursive else keep_file.parent.name
+                    if display_path == Path("."): display_path = "Current directory" # Nicer output for '.'
+                    try:
+                         print(f"    Location:                {display_path}")
+                    except ValueError: # Should not happen for parent, but relative_to might if directory was symlink etc.
+                         print(f"    Absolute Path:           {keep_file.parent}")
+                except Exception as e:
+                     print(f"  Keeping: '{keep_file.name}' (Info unavailable: {e})")
+                     display_path = keep_file.parent if recursive else keep_file.parent.name
+                     if display_path == Path("."): display_path = "Current directory"
+                     try:
+                          print(f"    Location:                {display_path}")
+                     except ValueError:
+                          print(f"    Absolute Path:           {keep_file.parent}")
+
+
+                # All other files in the group are duplicates to be removed
+                duplicates_in_group = files[1:]
+                # No need to check if duplicates_in_group is empty, files[1:] handles it
+
+                for file_to_delete, delete_stat in duplicates_in_group:
+                    try:
+                        file_size = delete_stat.st_size
+                        total_size_to_delete += file_size
+                        files_to_remove.append((file_to_delete, file_size))
+                        print(f"  Deleting: '{file_to_delete.name}' ({format_size(file_size)}) (created {time.ctime(delete_stat.st_ctime)})")
+                        display_path = file_to_delete.parent if recursive else file_to_delete.parent.name
+                        if display_path == Path("."): display_path = "Current directory"
+                        try:
+                            print(f"    Location:                {display_path}")
+                        except ValueError:
+                             print(f"    Absolute Path:           {file_to_delete.parent}")
 
-            except FileNotFoundError:
-                 print(f"  Skipping deletion: '{file_to_delete.name}' - File not found.")
-            except Exception as e:
-                 print(f"  Could not get info for file '{file_to_delete.name}': {e}. Skipping for deletion.")
+                    except FileNotFoundError:
+                         print(f"  Skipping deletion: '{file_to_delete.name}' - File not found.")
+                    except Exception as e:
+                         print(f"  Could not get info for file '{file_to_delete.name}': {e}. Skipping for deletion.")
 
-        print("-" * 20) # Separator between groups
+                print("-" * 20) # Separator between groups
     
     # Re-calculate total size based only on files successfully added to files_to_remove
     total_size_to_delete = sum(size for _, size in files_to_remove)
@@ -285,21 +516,25 @@ def find_and_remove_duplicates(directory_path_str, dry_run=False, pattern=r'\s*\
             print("This was a dry run. No files would have been deleted.")
         return
 
-    print("\n--- Summary of Files to be Removed ---")
-    # Sort files to remove by path for consistent output
-    files_to_remove.sort(key=lambda item: str(item[0]).lower())
-    
-    for file_path, size in files_to_remove:
-        print(f"- '{file_path.name}' ({format_size(size)})")
-        # Show relative path if recursive, or just directory name if not
-        display_path = file_path.parent if recursive else file_path.parent.name
-        if display_path == Path("."): display_path = "Current directory"
-        try:
-            print(f"  Location: {display_path}")
-        except ValueError:
-             print(f"  Absolute Path: {file_path.parent}")
+    if show_files:
+        with buffered_stdout():
+            print("\n--- Summary of Files to be Removed ---")
+            # Sort files to remove by path for consistent output
+            files_to_remove.sort(key=lambda item: fold_case(str(item[0])))
+        
+            for file_path, size in files_to_remove:
+                print(f"- '{file_path.name}' ({format_size(size)})")
+                # Show relative path if recursive, or just directory name if not
+                display_path = file_path.parent if recursive else file_path.parent.name
+                if display_path == Path("."): display_path = "Current directory"
+                try:
+                    print(f"  Location: {display_path}")
+                except ValueError:
+                     print(f"  Absolute Path: {file_path.parent}")
 
-    print(f"--------------------------------------")
+            print(f"--------------------------------------")
+    else:
+        print()
     print(f"Found {len(files_to_remove)} duplicate file(s) to delete (total size: {format_size(total_size_to_delete)}).")
     
     # In dry-run mode, exit here
@@ -327,48 +562,78 @@ def find_and_remove_duplicates(directory_path_str, dry_run=False, pattern=r'\s*\
     # Sort again just before deleting, in case something changed, or just keep alphabetical preview sort
     # Keeping alphabetical preview sort for user feedback consistency.
 
-    for file_path, size in files_to_remove: # Use size from the list, as stat() might fail during deletion
-        try:
-            # Double check the file still exists before attempting to delete
-            if file_path.exists():
-                # Get size again just before deleting for accuracy, although we have it from preview list
-                # size_before_delete = file_path.stat().st_size
-                print(f"Deleting: '{file_path.name}'...", end='')
+    # Files are deleted per directory, in batches of up to UNLINK_BATCH_SIZE, on a thread
+    # pool so several unlink() calls are in flight at once
+    files_by_directory = defaultdict(list)
+    for position, (file_path, _) in enumerate(files_to_remove):
+        files_by_directory[file_path.parent].append(position)
+
+    if delete_threads is None:
+        delete_threads = DEFAULT_DELETE_THREADS
+    # For each entry of files_to_remove: the batch it's in, and its index in that batch
+    batch_of_file = [None] * len(files_to_remove)
+    batches = []
+    for directory, positions in files_by_directory.items():
+        for start in range(0, len(positions), UNLINK_BATCH_SIZE):
+            batch = positions[start:start + UNLINK_BATCH_SIZE]
+            for index, position in enumerate(batch):
+                batch_of_file[position] = (len(batches), index)
+            batches.append((directory, [files_to_remove[position][0].name for position in batch]))
+
+    # Batches are submitted only a few at a time ahead of the one being reported, not
+    # all up front, so an interrupted run hasn't deleted far more than it has reported
+    batches_ahead = delete_threads * UNLINK_BATCHES_AHEAD
+    futures = []
+    executor = ThreadPoolExecutor(max_workers=delete_threads)
+    try:
+        # Report in list order, waiting for each file's batch as needed. Lines are
+        # buffered while batches are ready, and flushed before waiting on one
+        with buffered_stdout():
+            for (file_path, size), (batch_index, index) in zip(files_to_remove, batch_of_file): # Use size from the list, as stat() might fail during deletion
+                while len(futures) < len(batches) and len(futures) <= batch_index + batches_ahead:
+                    futures.append(executor.submit(unlink_files_in, *batches[len(futures)]))
+                future = futures[batch_index]
+                if not future.done():
+                    sys.stdout.flush()
+                outcome = future.result()[index]
                 display_path = file_path.parent if recursive else file_path.parent.name
                 if display_path == Path("."): display_path = "Current directory"
-                try:
-                    print(f" Location: {display_path}...", end='')
-                except ValueError:
-                    print(f" Path: {file_path.parent}...", end='')
-
-
-                file_path.unlink()  # Delete the file
-                print(" Success.")
-                deleted_count += 1
-                deleted_size += size # Use size from list collected earlier
-            else:
-                 print(f"Skipping: '{file_path.name}' - File no longer exists.")
-                 display_path = file_path.parent if recursive else file_path.parent.name
-                 if display_path == Path("."): display_path = "Current directory"
-                 try:
+                if outcome is FILE_GONE:
+                     print(f"Skipping: '{file_path.name}' - File no longer exists.")
                      print(f" Location: {display_path}")
-                 except ValueError:
-                     print(f" Path: {file_path.parent}")
-
+                     continue
 
-        except PermissionError:
-            print(f" Error: Permission denied.")
-        except FileNotFoundError:
-             # This case should be caught by .exists() check, but as a safeguard
-             print(f" Error: File not found.")
-        except OSError as e:
-            print(f" Error: OS error: {e}")
-        except Exception as e:
-            print(f" Error: An unexpected error occurred: {e}")
+                print(f"Deleting: '{file_path.name}'... Location: {display_path}...", end='')
+                if outcome is None:
+                    print(" Success.")
+                    deleted_count += 1
+                    deleted_size += size # Use size from list collected earlier
+                else:
+                    print(f" Error: {outcome}")
+    except BaseException:
+        # Ctrl+C: drop the queued batches instead of waiting for all of them on the way out
+        executor.shutdown(cancel_futures=True)
+        # Batches already running or done ahead of the report still deleted their files
+        finished = [future.result() for future in futures if not future.cancelled() and future.exception() is None]
+        unreported = sum(outcomes.count(None) for outcomes in finished) - deleted_count
+        if unreported > 0:
+            print(f"\nStopped. {unreported} more file(s) were deleted but not listed above.")
+        raise
+    executor.shutdown()
     
     print(f"\nFinished. {deleted_count} file(s) deleted ({format_size(deleted_size)} freed).")
 
 
+def positive_int(value):
+    """argparse type for thread counts: an integer of at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
 def main():
     parser = argparse.ArgumentParser(
         description="Find and remove duplicate files with markers like '(1)', '.copy', or ' - copy' in the filename.",
@@ -399,7 +664,7 @@ Examples (Command-line):
   
   # Use a custom pattern for files with " Copy" (space then Copy) and also detect .copy/.copy
   # This combines regex and the specific string checks.
-  # The regex pattern will be checked first in the cleaning process.
+  # The pattern and the .copy / - copy markers are matched together, leftmost first.
   python duplicate_remover.py . --pattern " Copy" --copy
 
 Examples (Interactive mode - run without any arguments):
@@ -419,7 +684,7 @@ Examples (Interactive mode - run without any arguments):
     )
     parser.add_argument(
         "--pattern", "-p",
-        default=r'\s*\(\d+\)', # Added \s* to handle space before (1)
+        default=DEFAULT_PATTERN, # Added \s* to handle space before (1)
         help="Regular expression pattern to match numerical duplicate indicators (default: '\\s*\\(\\d+\\)')"
     )
     parser.add_argument(
@@ -437,6 +702,23 @@ Examples (Interactive mode - run without any arguments):
         action="store_true",
         help="Recursively scan subdirectories."
     )
+    parser.add_argument(
+        "--stat-threads",
+        type=positive_int,
+        default=None,
+        help="Number of threads used to read file info for duplicate candidates (default: min(32, 4 * CPU count))"
+    )
+    parser.add_argument(
+        "--delete-threads",
+        type=positive_int,
+        default=None,
+        help=f"Number of threads used to delete files (default: {DEFAULT_DELETE_THREADS})"
+    )
+    parser.add_argument(
+        "--verbose", "-v",
+        action="store_true",
+        help="List every duplicate group and file even with --yes (always listed otherwise)"
+    )
     
     # --- Handle Interactive Mode if no arguments are provided ---
     # Check if only the script name is in sys.argv
@@ -478,7 +760,7 @@ Examples (Interactive mode - run without any arguments):
         find_and_remove_duplicates(
             target_directory,
             dry_run=False, # Interactive mode doesn't have a dry-run prompt by default
-            pattern=r'\s*\(\d+\)', # Use default pattern in interactive mode
+            pattern=DEFAULT_PATTERN, # Use default pattern in interactive mode
             auto_confirm=False, # Interactive mode always asks for confirmation unless -y is passed (which isn't prompted here)
             detect_copy=interactive_detect_copy,
             recursive=interactive_recursive
@@ -496,7 +778,10 @@ Examples (Interactive mode - run without any arguments):
         args.pattern,
         args.yes,
         args.copy,
-        args.recursive
+        args.recursive,
+        args.stat_threads,
+        args.delete_threads,
+        args.verbose
     )
 
 if __name__ == "__main__":
@@ -0,0 +1,312 @@
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    import resource
+except ImportError:  # Windows, where directories aren't opened by fd anyway
+    resource = None
+
+# Shared traversal core for clean_empty_dir.py and clean_empty_dir_deepseek.py.
+# The scripts only decide how a directory is removed and how results are reported.
+
+# Open directories and remove them relative to their parent's fd (openat/unlinkat) where
+# the platform supports it (not on Windows); otherwise fall back to full paths.
+# On Linux this already is the raw syscall path: os.scandir(fd) reads with getdents64 into
+# libc's reused buffer, and os.rmdir(name, dir_fd=fd) is unlinkat(fd, name, AT_REMOVEDIR).
+USE_DIR_FD = {os.open, os.rmdir} <= os.supports_dir_fd and os.scandir in os.supports_fd
+DIR_OPEN_FLAGS = os.O_RDONLY | getattr(os, "O_DIRECTORY", 0)
+# Most directory fds a sweep holds at once. Every worker keeps one open per level of the
+# subtree it's in, so without a cap deep trees need max_workers * depth of them. Past the
+# cap, directories are listed and removed by full path instead.
+MAX_DIR_FDS = 512
+
+# Kinds passed to the reporter callback
+REMOVED = "removed"          # detail: None
+KEPT = "kept"                # detail: list of up to `preview` entry names (only if preview > 0)
+SCAN_ERROR = "scan_error"    # detail: the OSError from opening/listing the directory
+REMOVE_ERROR = "remove_error"  # detail: the OSError from removing it
+
+Reporter = Callable[[str, str, OSError | list[str] | None], None]
+
+
+def dir_fd_budget() -> int:
+    """
+    Returns how many directory fds a sweep may hold: MAX_DIR_FDS, or half of the
+    process's open file limit if that is lower. The other half is left for the
+    scandir handles and whatever the caller has open.
+    """
+    if resource is None:
+        return MAX_DIR_FDS
+    soft_limit = resource.getrlimit(resource.RLIMIT_NOFILE)[0]
+    if soft_limit == resource.RLIM_INFINITY:
+        return MAX_DIR_FDS
+    return max(1, min(MAX_DIR_FDS, soft_limit // 2))
+
+
+class _DirFrame:
+    """A listed directory waiting for its subdirectories to be swept."""
+    __slots__ = ("path", "name", "parent_fd", "fd", "subdirs", "survived", "kept_names")
+
+    def __init__(self, path: str, name: str, parent_fd: int | None, fd: int | None,
+                 subdirs: list[str], survived: bool, kept_names: list[str]):
+        self.path = path
+        self.name = name
+        self.parent_fd = parent_fd
+        self.fd = fd
+        self.subdirs = subdirs        # Still to be swept, popped from the end
+        self.survived = survived      # Something in it stays, so it won't be removed
+        self.kept_names = kept_names
+
+
+def sweep_empty_dirs(root: str | os.PathLike, remover: Callable[[str], None] | None, reporter: Reporter,
+                     max_workers: int | None = None, preview: int = 0) -> tuple[int, int]:
+    """
+    Removes every directory under (and including) `root` that is empty, or becomes
+    empty once its empty subdirectories are gone.
+
+    Each directory is listed exactly once with os.scandir: whether it's empty after
+    cleanup follows from what its children returned, so there's no second listing and
+    no rmdir attempt on a directory that still has something in it. The top-level
+    subdirectories are swept in parallel on a thread pool; filesystem calls release
+    the GIL, so this overlaps their I/O latency. Each subtree below that is handled
+    by a single thread, so `remover` and `reporter` must be thread-safe.
+
+    Args:
+        root (str | os.PathLike): The directory to start from.
+        remover (Callable[[str], None] | None): Called with the path of each empty
+            directory, children before their parents. None removes it with os.rmdir,
+            relative to the parent's fd where supported. Raising OSError marks the
+            directory as not removed.
+        reporter (Reporter): Called as reporter(kind, path, detail) with one of
+            REMOVED, KEPT, SCAN_ERROR or REMOVE_ERROR.
+        max_workers (int | None): Threads used for the top-level subdirectories.
+            Defaults to min(32, 4 * CPU count). Open directory fds are capped by
+            dir_fd_budget() across all of them.
+        preview (int): If non-zero, report KEPT directories along with up to this many
+            of the names that kept them.
+
+    Returns:
+        tuple: (removed_count, error_count)
+    """
+    removed_count = 0
+    error_count = 0
+    # Counters are shared by the worker threads
+    count_lock = threading.Lock()
+    # Taken without blocking for each directory fd opened: a worker waiting for one
+    # while holding its ancestors' could deadlock, so it falls back to paths instead
+    fd_slots = threading.BoundedSemaphore(dir_fd_budget())
+    # Set when the sweep is being abandoned (Ctrl+C, or an error in another subtree),
+    # so the workers stop instead of removing everything still queued
+    cancelled = threading.Event()
+    # st_dev -> whether that filesystem's directory st_nlink can be trusted to count
+    # subdirectories. Decided by the first full listing there that finds a subdirectory.
+    nlink_counts_subdirs: dict[int, bool] = {}
+
+    # Looked up once instead of through the os module on every directory
+    scandir = os.scandir
+    join = os.path.join
+    fstat = os.fstat
+    rmdir = os.rmdir
+
+    # How an empty directory goes away is fixed for the whole sweep, so pick it once.
+    # The root, and anything below a directory that wasn't opened, has no parent fd
+    # and is removed by its full path.
+    if remover is not None:
+        def remove(path: str, name: str, parent_fd: int | None):
+            remover(path)
+    elif USE_DIR_FD:
+        def remove(path: str, name: str, parent_fd: int | None):
+            if parent_fd is None:
+                rmdir(path)
+            else:
+                rmdir(name, dir_fd=parent_fd)
+    else:
+        def remove(path: str, name: str, parent_fd: int | None):
+            rmdir(path)
+
+    def close_dir(fd: int):
+        os.close(fd)
+        fd_slots.release()
+
+    def open_dir(path: str, name: str, parent_fd: int | None, is_root: bool = False) -> _DirFrame | bool:
+        """
+        Lists one directory. Where supported, it is opened by `name` relative to
+        `parent_fd` (openat), so the kernel resolves one path component instead of
+        the whole path; `path` is then only used for reporting. If the fd budget is
+        used up, or the parent has no fd, it is listed by `path` without an fd.
+
+        Returns:
+            _DirFrame | bool: The listed directory; or, if it couldn't be listed,
+                True if it's gone and False if it stays.
+        """
+        nonlocal error_count
+        survived = False
+        subdirs = []
+        kept_names = []
+        fd = None
+        try:
+            if USE_DIR_FD and (parent_fd is not None or is_root) and fd_slots.acquire(blocking=False):
+                try:
+                    if parent_fd is None:
+                        fd = os.open(path, DIR_OPEN_FLAGS)
+                    else:
+                        # O_NOFOLLOW: don't descend if the entry was swapped for a symlink meanwhile
+                        fd = os.open(name, DIR_OPEN_FLAGS | os.O_NOFOLLOW, dir_fd=parent_fd)
+                finally:
+                    if fd is None:
+                        fd_slots.release()
+            # A POSIX directory's st_nlink is 2 + its number of subdirectories, if the
+            # filesystem keeps count. Some don't: btrfs, or ext4 past ~65000 subdirectories,
+            # report 1, and SMB/CIFS mounts without Unix extensions report a constant 2.
+            # So it's only relied on once a full listing on the same device has matched it.
+            # Then, once all subdirectories are found and something else keeps `path` alive,
+            # the rest of a large listing can't change the outcome, so it isn't read.
+            expected_subdirs = -1
+            nlink = dev = None
+            if fd is not None:
+                st = fstat(fd)
+                nlink = st.st_nlink
+                dev = st.st_dev
+                if nlink >= 2 and nlink_counts_subdirs.get(dev):
+                    expected_subdirs = nlink - 2
+            with scandir(path if fd is None else fd) as it:
+                for entry in it:
+                    # is_dir(follow_symlinks=False) is answered from the d_type that getdents
+                    # already returned, so there's no lstat per entry. Anything else (files,
+                    # symlinks, sockets...) just keeps `path` alive; no need to stat it.
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.name)
+                    else:
+                        survived = True
+                        if len(kept_names) < preview:
+                            kept_names.append(entry.name)
+                    if survived and len(subdirs) == expected_subdirs:
+                        break
+                else:
+                    # A complete listing with a subdirectory in it tells whether st_nlink
+                    # counts them here (an empty one matches a constant 2 by chance)
+                    if dev is not None and subdirs and dev not in nlink_counts_subdirs:
+                        nlink_counts_subdirs[dev] = nlink - 2 == len(subdirs)
+        except FileNotFoundError:
+            # Removed by something else since its parent was listed; as good as deleted
+            if fd is not None:
+                close_dir(fd)
+            return True
+        except OSError as e:
+            reporter(SCAN_ERROR, path, e)
+            with count_lock:
+                error_count += 1
+            if fd is not None:
+                close_dir(fd)
+            return False
+        # Swept by popping from the end, so reverse to keep listing order
+        subdirs.reverse()
+        return _DirFrame(path, name, parent_fd, fd, subdirs, survived, kept_names)
+
+    def child_done(frame: _DirFrame, child: str, removed: bool):
+        """Records in `frame` whether its subdirectory `child` was removed."""
+        if not removed:
+            frame.survived = True
+            if len(frame.kept_names) < preview:
+                frame.kept_names.append(child)
+
+    def finish(frame: _DirFrame) -> bool:
+        """
+        Closes a directory whose subdirectories have all been swept and removes it
+        if nothing survived.
+
+        Returns:
+            bool: True if it was removed (or is gone).
+        """
+        nonlocal removed_count, error_count
+        path = frame.path
+        if frame.fd is not None:
+            close_dir(frame.fd)
+
+        if frame.survived:
+            if preview:
+                reporter(KEPT, path, frame.kept_names)
+            return False
+
+        try:
+            remove(path, frame.name, frame.parent_fd)
+        except FileNotFoundError:
+            return True
+        except OSError as e:
+            reporter(REMOVE_ERROR, path, e)
+            with count_lock:
+                error_count += 1
+            return False
+        reporter(REMOVED, path, None)
+        with count_lock:
+            removed_count += 1
+        return True
+
+    def sweep(path: str, name: str, parent_fd: int | None) -> bool:
+        """
+        Sweeps the subtree at `path` on the calling thread. It's walked depth-first
+        with an explicit stack rather than by recursion, so deep trees don't hit the
+        recursion limit; each directory is finished (post-order) once all of its
+        subdirectories have been, and stays open meanwhile so they can be opened and
+        removed relative to it.
+
+        Returns:
+            bool: True if `path` was removed (or is gone). False if it stays, or the
+                sweep was cancelled.
+        """
+        if cancelled.is_set():
+            return False
+        top = open_dir(path, name, parent_fd)
+        if top is True or top is False:
+            return top
+        stack = [top]
+        while True:
+            if cancelled.is_set():
+                for frame in stack:
+                    if frame.fd is not None:
+                        close_dir(frame.fd)
+                return False
+            frame = stack[-1]
+            if frame.subdirs:
+                child = frame.subdirs.pop()
+                opened = open_dir(join(frame.path, child), child, frame.fd)
+                if opened is True or opened is False:
+                    child_done(frame, child, opened)
+                else:
+                    stack.append(opened)
+                continue
+            stack.pop()
+            removed = finish(frame)
+            if not stack:
+                return removed
+            child_done(stack[-1], frame.name, removed)
+
+    if max_workers is None:
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+    root = os.fspath(root)
+    top = open_dir(root, root, None, is_root=True)
+    if top is True or top is False:
+        return removed_count, error_count
+    # The root's subdirectories are swept concurrently, one subtree per task. Only
+    # sibling subtrees run at once; a single directory's children are never removed
+    # from several threads at the same time.
+    pool = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        pending = {pool.submit(sweep, join(root, child), child, top.fd): child
+                   for child in reversed(top.subdirs)}
+        top.subdirs.clear()
+        for future in as_completed(pending):
+            child_done(top, pending[future], future.result())
+    except BaseException:
+        # Drop the queued subtrees and stop the running ones at their next directory,
+        # rather than letting the pool finish the whole sweep on the way out
+        cancelled.set()
+        pool.shutdown(cancel_futures=True)
+        if top.fd is not None:
+            close_dir(top.fd)
+        raise
+    pool.shutdown()
+    finish(top)
+    return removed_count, error_count